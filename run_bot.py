@@ -7,9 +7,12 @@ import os
 import asyncio
 from src.telegram_bot.family_bot import FamilyTelegramBot
 
+# Read once at import; the runner only needs it at startup
+TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN')
+
 def main():
     """Main function to run the Telegram bot."""
-    token = os.environ.get('TELEGRAM_BOT_TOKEN')
+    token = TELEGRAM_BOT_TOKEN
     
     if not token:
         print("❌ TELEGRAM_BOT_TOKEN environment variable is required")
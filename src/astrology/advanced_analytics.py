@@ -3,68 +3,156 @@ Advanced Astrology Analytics for Personal/Family Companion
 Includes Dasha, Transits, Yogas, and detailed chart analysis
 """
 
-import ephem
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import math
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 from loguru import logger
 
+if TYPE_CHECKING:
+    import ephem
+
+# ephem is imported on first use: it loads a compiled extension and many
+# bot flows never touch dasha or transit calculations.
+
+# Bodies ephem can compute directly (Rahu/Ketu are derived points)
+_TRANSIT_PLANETS = ('Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn')
+
+# Vimshottari dasha sequence (simplified) with its cumulative end years
+_DASHA_LORDS = ('Ketu', 'Venus', 'Sun', 'Moon', 'Mars', 'Rahu', 'Jupiter', 'Saturn', 'Mercury')
+_DASHA_YEARS = (7, 20, 6, 10, 7, 18, 16, 19, 17)
+_DASHA_ENDS = tuple(accumulate(_DASHA_YEARS))
+_DASHA_TOTAL = _DASHA_ENDS[-1]
+
+# Conjunction yogas as data rows:
+# (planet, other planet, orb, strong orb, name, description)
+_YOGA_RULES = (
+    ('Jupiter', 'Moon', 30, 10, 'Gajakesari Yoga',
+     'Jupiter-Moon conjunction brings wisdom and prosperity'),
+    ('Mercury', 'Sun', 15, 5, 'Budh-Aditya Yoga',
+     'Mercury-Sun conjunction brings intelligence and communication skills'),
+    ('Saturn', 'Moon', 30, 10, 'Shasha Yoga',
+     'Saturn-Moon conjunction brings discipline and patience'),
+)
+_YOGA_PLANETS = tuple({planet for rule in _YOGA_RULES for planet in rule[:2]})
+
+# Fixed parts of the advanced prediction text
+_HEADER_TEMPLATE = "🌟 **Advanced {ptype} Prediction for {name}**\n\n"
+_GUIDANCE_FOOTER = (
+    "**💫 Cosmic Guidance:**\n"
+    "Based on your advanced chart analysis, focus on:\n"
+    "• Personal growth and spiritual development\n"
+    "• Family harmony and relationships\n"
+    "• Health and wellness practices\n"
+    "• Career and life purpose alignment\n\n"
+    "**🎯 Today's Focus:** Trust your intuition and follow your heart's calling! ✨"
+)
+
+
+def _angular_distance(a: float, b: float) -> float:
+    """Shortest arc between two ecliptic longitudes in degrees (wraps at 360)."""
+    d = (a - b) % 360.0
+    return d if d <= 180.0 else 360.0 - d
+
+
+@lru_cache(maxsize=2048)
+def _parse_birth(birth_date: str, birth_time: str) -> datetime:
+    """Parse ``YYYY-MM-DD`` / ``HH:MM`` birth details, once per distinct pair."""
+    return datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
+
+
+@lru_cache(maxsize=1)
+def _transit_bodies() -> Tuple[Tuple[str, Any], ...]:
+    """Create one ephem body per transit planet; bodies are reusable after compute."""
+    import ephem
+    return tuple((name, getattr(ephem, name)()) for name in _TRANSIT_PLANETS)
+
+
+@lru_cache(maxsize=512)
+def _dasha_for_day(birth_date: str, birth_time: str, today: date) -> Dict[str, Any]:
+    """Vimshottari dasha as of ``today``; the result only changes once per day."""
+    import ephem
+    
+    # Parse birth date and time
+    birth_dt = _parse_birth(birth_date, birth_time)
+    
+    # Calculate Moon's longitude at birth
+    birth_place = ephem.Observer()
+    birth_place.date = birth_dt
+    moon = ephem.Moon()
+    moon.compute(birth_place)
+    
+    # Calculate current dasha
+    current_date = datetime.combine(today, datetime.min.time())
+    years_since_birth = (current_date - birth_dt).days / 365.25
+    
+    # Locate the current dasha lord in the precomputed cumulative table
+    current_cycle = years_since_birth % _DASHA_TOTAL
+    index = bisect_right(_DASHA_ENDS, current_cycle)
+    dasha_end = _DASHA_ENDS[index]
+    
+    return {
+        'current_dasha': _DASHA_LORDS[index],
+        'dasha_start': dasha_end - _DASHA_YEARS[index],
+        'dasha_end': dasha_end,
+        'years_remaining': dasha_end - current_cycle
+    }
+
+
+@lru_cache(maxsize=64)
+def _observer_for(birth_place: str) -> 'ephem.Observer':
+    """Build the observer for a birth place once; callers only set ``date``."""
+    import ephem
+    
+    observer = ephem.Observer()
+    # Default to Mumbai if place not parsed; floats are read as radians
+    observer.lat = math.radians(19.0760)
+    observer.lon = math.radians(72.8777)
+    return observer
+
+
+# Field order of the flat transit rows kept in the cache
+_TRANSIT_FIELDS = ('longitude', 'latitude', 'distance', 'phase')
+
+
+@lru_cache(maxsize=64)
+def _transits_for_hour(birth_place: str, hour: datetime) -> Tuple[Tuple[str, float, float, float, float], ...]:
+    """Planet positions at ``hour``; transits barely move within an hour.
+    
+    Rows are flat ``(name, *_TRANSIT_FIELDS)`` tuples so the cache holds
+    plain floats rather than a nested dict per planet. Angles are degrees.
+    """
+    observer = _observer_for(birth_place)
+    observer.date = hour
+    
+    # Compute every visible body against the same observer in one pass
+    bodies = _transit_bodies()
+    for _, body in bodies:
+        body.compute(observer)
+    
+    return tuple(
+        (name, math.degrees(body.hlong), math.degrees(body.hlat),
+         float(body.earth_distance), float(body.phase))
+        for name, body in bodies
+    )
+
+
 class AdvancedAstrologyAnalytics:
     """Advanced astrology calculations for personal/family use."""
     
     def __init__(self):
-        self.planets = {
-            'Sun': ephem.Sun,
-            'Moon': ephem.Moon,
-            'Mercury': ephem.Mercury,
-            'Venus': ephem.Venus,
-            'Mars': ephem.Mars,
-            'Jupiter': ephem.Jupiter,
-            'Saturn': ephem.Saturn,
-            'Rahu': None,  # Will be calculated
-            'Ketu': None    # Will be calculated
-        }
+        self.planets = _TRANSIT_PLANETS + (
+            'Rahu',  # Will be calculated
+            'Ketu'   # Will be calculated
+        )
     
     def calculate_dasha(self, birth_date: str, birth_time: str) -> Dict[str, Any]:
         """Calculate Vimshottari Dasha periods."""
         try:
-            # Parse birth date and time
-            birth_dt = datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
-            
-            # Calculate Moon's longitude at birth
-            birth_place = ephem.Observer()
-            birth_place.date = birth_dt
-            moon = ephem.Moon()
-            moon.compute(birth_place)
-            
-            # Calculate dasha periods (simplified Vimshottari)
-            dasha_periods = {
-                'Ketu': 7, 'Venus': 20, 'Sun': 6, 'Moon': 10,
-                'Mars': 7, 'Rahu': 18, 'Jupiter': 16, 'Saturn': 19, 'Mercury': 17
-            }
-            
-            # Calculate current dasha
-            current_date = datetime.now()
-            years_since_birth = (current_date - birth_dt).days / 365.25
-            
-            # Determine current dasha lord and period
-            total_years = sum(dasha_periods.values())
-            current_cycle = years_since_birth % total_years
-            
-            current_dasha = None
-            accumulated_years = 0
-            
-            for planet, years in dasha_periods.items():
-                if accumulated_years <= current_cycle < accumulated_years + years:
-                    current_dasha = planet
-                    break
-                accumulated_years += years
-            
-            return {
-                'current_dasha': current_dasha,
-                'dasha_start': accumulated_years,
-                'dasha_end': accumulated_years + dasha_periods.get(current_dasha, 0),
-                'years_remaining': (accumulated_years + dasha_periods.get(current_dasha, 0)) - current_cycle
-            }
+            # Cached per (birth details, day); copy so callers can't mutate the cache
+            return dict(_dasha_for_day(birth_date, birth_time, date.today()))
             
         except Exception as e:
             logger.error(f"Error calculating dasha: {e}")
@@ -74,29 +162,14 @@ class AdvancedAstrologyAnalytics:
         """Calculate current planetary transits and their effects."""
         try:
             # Parse birth details
-            birth_dt = datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
-            
-            # Set up observer for birth place
-            observer = ephem.Observer()
-            observer.lat = '19.0760'  # Default to Mumbai if place not parsed
-            observer.lon = '72.8777'
-            observer.date = datetime.now()
-            
-            transits = {}
-            
-            # Calculate current positions of planets
-            for planet_name, planet_class in self.planets.items():
-                if planet_class:
-                    planet = planet_class()
-                    planet.compute(observer)
-                    transits[planet_name] = {
-                        'longitude': float(planet.hlong),
-                        'latitude': float(planet.hlat),
-                        'distance': float(planet.earth_distance),
-                        'phase': float(planet.phase) if hasattr(planet, 'phase') else 0
-                    }
+            birth_dt = _parse_birth(birth_date, birth_time)
             
-            return transits
+            # Cached per (place, hour); expand the flat rows for callers
+            hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+            return {
+                name: dict(zip(_TRANSIT_FIELDS, values))
+                for name, *values in _transits_for_hour(birth_place, hour)
+            }
             
         except Exception as e:
             logger.error(f"Error calculating transits: {e}")
@@ -107,36 +180,20 @@ class AdvancedAstrologyAnalytics:
         yogas = []
         
         try:
-            # Check for common yogas
-            sun_pos = birth_chart.get('Sun', {}).get('longitude', 0)
-            moon_pos = birth_chart.get('Moon', {}).get('longitude', 0)
-            
-            # Gajakesari Yoga (Jupiter-Moon conjunction)
-            jupiter_pos = birth_chart.get('Jupiter', {}).get('longitude', 0)
-            if abs(jupiter_pos - moon_pos) < 30:  # Within 30 degrees
-                yogas.append({
-                    'name': 'Gajakesari Yoga',
-                    'description': 'Jupiter-Moon conjunction brings wisdom and prosperity',
-                    'strength': 'Strong' if abs(jupiter_pos - moon_pos) < 10 else 'Moderate'
-                })
-            
-            # Budh-Aditya Yoga (Mercury-Sun conjunction)
-            mercury_pos = birth_chart.get('Mercury', {}).get('longitude', 0)
-            if abs(mercury_pos - sun_pos) < 15:  # Within 15 degrees
-                yogas.append({
-                    'name': 'Budh-Aditya Yoga',
-                    'description': 'Mercury-Sun conjunction brings intelligence and communication skills',
-                    'strength': 'Strong' if abs(mercury_pos - sun_pos) < 5 else 'Moderate'
-                })
+            # Pull each planet's longitude once, then sweep every rule
+            longitudes = {
+                planet: birth_chart.get(planet, {}).get('longitude', 0)
+                for planet in _YOGA_PLANETS
+            }
             
-            # Shasha Yoga (Saturn-Moon conjunction)
-            saturn_pos = birth_chart.get('Saturn', {}).get('longitude', 0)
-            if abs(saturn_pos - moon_pos) < 30:
-                yogas.append({
-                    'name': 'Shasha Yoga',
-                    'description': 'Saturn-Moon conjunction brings discipline and patience',
-                    'strength': 'Strong' if abs(saturn_pos - moon_pos) < 10 else 'Moderate'
-                })
+            for planet_a, planet_b, orb, strong_orb, name, description in _YOGA_RULES:
+                distance = _angular_distance(longitudes[planet_a], longitudes[planet_b])
+                if distance < orb:
+                    yogas.append({
+                        'name': name,
+                        'description': description,
+                        'strength': 'Strong' if distance < strong_orb else 'Moderate'
+                    })
             
             return yogas
             
@@ -177,39 +234,32 @@ class AdvancedAstrologyAnalytics:
                                          prediction_type: str, user_name: str) -> str:
         """Generate human-readable prediction text."""
         
-        prediction_text = f"🌟 **Advanced {prediction_type.title()} Prediction for {user_name}**\n\n"
+        parts = [_HEADER_TEMPLATE.format(ptype=prediction_type.title(), name=user_name)]
         
         # Dasha information
         if 'current_dasha' in dasha and not 'error' in dasha:
-            prediction_text += f"**🕉️ Current Dasha:** {dasha['current_dasha']}\n"
-            prediction_text += f"**⏰ Years Remaining:** {dasha.get('years_remaining', 0):.1f} years\n\n"
+            parts.append(f"**🕉️ Current Dasha:** {dasha['current_dasha']}\n")
+            parts.append(f"**⏰ Years Remaining:** {dasha.get('years_remaining', 0):.1f} years\n\n")
         
         # Transit information
         if 'Sun' in transits and not 'error' in transits:
-            prediction_text += "**🌞 Current Transits:**\n"
+            parts.append("**🌞 Current Transits:**\n")
             for planet, data in transits.items():
                 if isinstance(data, dict) and 'longitude' in data:
-                    prediction_text += f"• {planet}: {data['longitude']:.1f}°\n"
-            prediction_text += "\n"
+                    parts.append(f"• {planet}: {data['longitude']:.1f}°\n")
+            parts.append("\n")
         
         # Yogas
         if yogas:
-            prediction_text += "**✨ Active Yogas:**\n"
+            parts.append("**✨ Active Yogas:**\n")
             for yoga in yogas:
-                prediction_text += f"• {yoga['name']} ({yoga['strength']}): {yoga['description']}\n"
-            prediction_text += "\n"
+                parts.append(f"• {yoga['name']} ({yoga['strength']}): {yoga['description']}\n")
+            parts.append("\n")
         
         # Personalized guidance
-        prediction_text += "**💫 Cosmic Guidance:**\n"
-        prediction_text += "Based on your advanced chart analysis, focus on:\n"
-        prediction_text += "• Personal growth and spiritual development\n"
-        prediction_text += "• Family harmony and relationships\n"
-        prediction_text += "• Health and wellness practices\n"
-        prediction_text += "• Career and life purpose alignment\n\n"
-        
-        prediction_text += "**🎯 Today's Focus:** Trust your intuition and follow your heart's calling! ✨"
+        parts.append(_GUIDANCE_FOOTER)
         
-        return prediction_text
+        return "".join(parts)
 
 # Global instance
 advanced_analytics = AdvancedAstrologyAnalytics() 
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Marathi festival text for the Festival Calendar Engine
+Kept apart from the English table and imported only when Marathi is requested
+"""
+
+FESTIVALS_2024_MR = {
+    'makar_sankranti': {
+        'name_mr': 'मकर संक्रांति',
+        'significance_mr': 'सूर्य मकर राशीत प्रवेश करतो, पीक सण, नवीन सुरुवाती',
+        'rituals_mr': (
+            'पवित्र नद्यांमध्ये स्नान करा',
+            'तीळ आणि गुळ दान करा',
+            'सूर्याचे स्वागत करण्यासाठी पतंग उडवा',
+            'पारंपारिक मिठाई तयार करा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक पतंग उडवण्याची स्पर्धा',
+            'एकत्र पारंपारिक मिठाई तयार करा',
+            'कुटुंब म्हणून मंदिरात जा',
+            'शेजाऱ्यांसोबत मिठाई सामायिक करा'
+        )
+    },
+    'vasant_panchami': {
+        'name_mr': 'वसंत पंचमी',
+        'significance_mr': 'सरस्वती देवीची पूजा, वसंत सण, शिक्षण',
+        'rituals_mr': (
+            'सरस्वती देवीची पूजा करा',
+            'पिवळे कपडे घाला',
+            'नवीन शिकण्याच्या क्रियाकलापांना सुरुवात करा',
+            'पिवळी फुले अर्पण करा'
+        ),
+        'family_activities_mr': (
+            'मुले नवीन शैक्षणिक क्रियाकलाप सुरू करतात',
+            'ज्ञानासाठी कौटुंबिक प्रार्थना',
+            'एकत्र वसंत सफाई',
+            'बागेत नवीन फुले लावा'
+        )
+    },
+    'maha_shivratri': {
+        'name_mr': 'महा शिवरात्री',
+        'significance_mr': 'शिव देवाची पूजा, आध्यात्मिक जागृती, उपवास',
+        'rituals_mr': (
+            'उपवास करा आणि रात्रभर जागे रहा',
+            'बेलपत्रांसह शिव देवाची पूजा करा',
+            'ॐ नमः शिवाय जप करा',
+            'शिव मंदिरात जा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक रात्र जागरण',
+            'शिव देवाबद्दल कथा सांगणे',
+            'एकत्र विशेष प्रसाद तयार करा',
+            'कुटुंब म्हणून ध्यान'
+        )
+    },
+    'holi': {
+        'name_mr': 'होळी',
+        'significance_mr': 'रंगांचा सण, चांगल्यावर वाईटाचा विजय, वसंत',
+        'rituals_mr': (
+            'नैसर्गिक रंगांसह खेळा',
+            'होळिका दहन करा',
+            'मिठाई आणि शुभेच्छा विनिमय करा',
+            'क्षमा करा आणि वैर विसरा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक रंग खेळ',
+            'पारंपारिक मिठाई तयार करा',
+            'मित्र आणि नातेवाईकांना भेट द्या',
+            'एकत्र गाणे आणि नृत्य करा'
+        )
+    },
+    'ram_navami': {
+        'name_mr': 'राम नवमी',
+        'significance_mr': 'श्री रामाचा जन्म, धर्म, आदर्श नेतृत्व',
+        'rituals_mr': (
+            'रामायण वाचा',
+            'श्री रामाची पूजा करा',
+            'राम मंत्र जप करा',
+            'दैनंदिन जीवनात धर्माचा पाठपुरावा करा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक रामायण वाचन',
+            'रामाबद्दल नाटक किंवा कथा सांगणे',
+            'धर्माचरणाचा सराव',
+            'गरजूंना मदत करा'
+        )
+    },
+    'hanuman_jayanti': {
+        'name_mr': 'हनुमान जयंती',
+        'significance_mr': 'हनुमानाचा जन्म, भक्ती, शक्ती, सेवा',
+        'rituals_mr': (
+            'हनुमान मंदिरात जा',
+            'हनुमान चालीसा जप करा',
+            'सिंदूर आणि तेल अर्पण करा',
+            'शारीरिक व्यायाम करा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक हनुमान चालीसा पठण',
+            'एकत्र शारीरिक क्रियाकलाप',
+            'समुदायाला सेवा',
+            'शक्ती वाढवणारे व्यायाम'
+        )
+    },
+    'krishna_janmashtami': {
+        'name_mr': 'कृष्ण जन्माष्टमी',
+        'significance_mr': 'श्री कृष्णाचा जन्म, दैवी प्रेम, ज्ञान',
+        'rituals_mr': (
+            'मध्यरात्रीपर्यंत उपवास करा',
+            'बाल कृष्णाचे पाळणे सजवा',
+            'भजने आणि कीर्तने गावा',
+            'भगवद्गीता वाचा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक भजन गायन',
+            'दही हंडी साजरा',
+            'मुलांसाठी कृष्ण कथा',
+            'आध्यात्मिक चर्चा'
+        )
+    },
+    'ganesh_chaturthi': {
+        'name_mr': 'गणेश चतुर्थी',
+        'significance_mr': 'श्री गणेशाचा जन्म, ज्ञान, यश',
+        'rituals_mr': (
+            'घरी गणेश मूर्ती स्थापना करा',
+            'मोदक आणि दूर्वा गवत अर्पण करा',
+            'गणेश मंत्र जप करा',
+            'दररोज आरती करा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक गणेश सजावट',
+            'एकत्र मोदक तयार करा',
+            'सांस्कृतिक कार्यक्रम',
+            'समुदाय साजरे'
+        )
+    },
+    'navratri': {
+        'name_mr': 'नवरात्री',
+        'significance_mr': 'देवीची नऊ रात्री पूजा, आध्यात्मिक शुद्धी',
+        'rituals_mr': (
+            'नऊ दिवस उपवास करा',
+            'देवीच्या विविध रूपांची पूजा करा',
+            'गरबा आणि डांडिया करा',
+            'दुर्गा सप्तशती वाचा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक गरबा रात्री',
+            'एकत्र पारंपारिक उपवास',
+            'सांस्कृतिक नृत्य कार्यक्रम',
+            'आध्यात्मिक कौटुंबिक वेळ'
+        )
+    },
+    'diwali': {
+        'name_mr': 'दिवाळी',
+        'significance_mr': 'दिव्यांचा सण, चांगल्यावर वाईटाचा विजय',
+        'rituals_mr': (
+            'दिवे आणि दीप लावा',
+            'लक्ष्मी देवीची पूजा करा',
+            'घर साफ करा आणि सजवा',
+            'मिठाई आणि भेटवस्तू विनिमय करा'
+        ),
+        'family_activities_mr': (
+            'कौटुंबिक सजावट स्पर्धा',
+            'पारंपारिक मिठाई तयार करणे',
+            'आतषबाजी आणि साजरे',
+            'नातेवाईक आणि मित्रांना भेट द्या'
+        )
+    }
+}
@@ -0,0 +1,111 @@
+"""
+Marathi text for the Health & Wellness Engine
+Kept apart from the English tables and imported only when Marathi is requested
+"""
+
+SEASON_GUIDES_MR = {
+    'spring': {
+        'name': 'वसंत',
+        'dosha': 'कफ',
+        'description': 'वसंत हा नूतनीकरण आणि वाढीचा काळ आहे. कफ दोष नैसर्गिकरित्या जास्त असतो.',
+        'diet': (
+            'हलके, कोरडे आणि उबदार अन्न',
+            'कडू, तुरट आणि तिखट चवी',
+            'मध, आले, हळद',
+            'जड, तैलयुक्त आणि गोड अन्न टाळा'
+        ),
+        'lifestyle': (
+            'सकाळी लवकर व्यायाम',
+            'उबदार तेलाने कोरडी मालिश',
+            'नाक साफ करणे (नेती)',
+            'मर्यादित प्रमाणात सूर्यप्रकाश'
+        ),
+        'herbs': ('आले', 'हळद', 'मिरी', 'मध'),
+        'activities': ('योग', 'प्राणायाम', 'चालणे', 'बागकाम')
+    },
+    'summer': {
+        'name': 'उन्हाळा',
+        'dosha': 'पित्त',
+        'description': 'उन्हाळा गरम आणि तीव्र असतो. पित्त दोष नैसर्गिकरित्या जास्त असतो.',
+        'diet': (
+            'थंड, गोड आणि कडू अन्न',
+            'नारळ पाणी, काकडी, पुदीना',
+            'गरम, तिखट आणि आंबट अन्न टाळा',
+            'थंड पेयांसह जलयोजन राखा'
+        ),
+        'lifestyle': (
+            'थंड स्नान',
+            'चंद्रप्रकाश',
+            'थंड तासांमध्ये सौम्य व्यायाम',
+            'दुपारचे सूर्य टाळा'
+        ),
+        'herbs': ('नारळ', 'पुदीना', 'कोथिंबीर', 'गुलाब'),
+        'activities': ('पोहणे', 'चंद्र पाहणे', 'सौम्य योग', 'थंड चालणे')
+    },
+    'autumn': {
+        'name': 'शरद',
+        'dosha': 'वात',
+        'description': 'शरद कोरडा आणि वाऱ्याचा असतो. वात दोष नैसर्गिकरित्या जास्त असतो.',
+        'diet': (
+            'उबदार, ओलसर आणि गोड अन्न',
+            'तूप, तिळाचे तेल, उबदार दूध',
+            'थंड, कोरडे आणि कडू अन्न टाळा',
+            'नियमित जेवणाचे वेळ'
+        ),
+        'lifestyle': (
+            'उबदार तेल मालिश (अभ्यंग)',
+            'उबदार स्नान',
+            'सौम्य, जमिनीवरचे व्यायाम',
+            'नियमित झोपेचे वेळ'
+        ),
+        'herbs': ('तिळ', 'तूप', 'उबदार मसाले', 'काजू'),
+        'activities': ('जमिनीवरचा योग', 'उबदार स्नान', 'सौम्य चालणे', 'ध्यान')
+    },
+    'winter': {
+        'name': 'हिवाळा',
+        'dosha': 'वात',
+        'description': 'हिवाळा थंड आणि कोरडा असतो. वात दोष नैसर्गिकरित्या जास्त असतो.',
+        'diet': (
+            'उबदार, जड आणि गोड अन्न',
+            'गरम सूप, स्टू आणि उबदार पेय',
+            'तूप, काजू आणि उबदार मसाले',
+            'थंड, हलके आणि कोरडे अन्न टाळा'
+        ),
+        'lifestyle': (
+            'दररोज उबदार तेल मालिश',
+            'उबदार स्नान आणि वाफ',
+            'उष्णता निर्माण करण्यासाठी मध्यम व्यायाम',
+            'लवकर झोपणे आणि उशीरा उठणे'
+        ),
+        'herbs': ('आले', 'दालचिनी', 'वेलची', 'मिरी'),
+        'activities': ('उबदार योग', 'वाफ चिकित्सा', 'उबदार चालणे', 'विश्रांती')
+    }
+}
+
+DAILY_ROUTINE_MR = {
+    'morning': (
+        'सूर्योदयापूर्वी उठा (ब्रह्म मुहूर्त)',
+        'लिंबू आणि मधासह उबदार पाणी प्या',
+        'सूर्य नमस्कार सराव करा',
+        'तोंडाच्या आरोग्यासाठी तेल कुल्ला',
+        'मानसिक स्पष्टतेसाठी ध्यान'
+    ),
+    'afternoon': (
+        'पचनाच्या शिखर वेळेत दुपारचे जेवण (12-2 PM)',
+        'जेवणानंतर थोडी चालणे',
+        'खोलीच्या तापमानाच्या पाण्याने जलयोजन राखा',
+        'खोल श्वासोच्छवासाचे व्यायाम'
+    ),
+    'evening': (
+        'सूर्यास्तापूर्वी हलके रात्रीचे जेवण',
+        'सौम्य संध्याकाळी चालणे',
+        'कौटुंबिक वेळ आणि विश्रांती',
+        'चांगल्या झोपेसाठी तयारी'
+    ),
+    'night': (
+        'लवकर झोपणे (10 PM)',
+        'झोपण्यापूर्वी 1 तास स्क्रीन टाळा',
+        'हलके वाचन किंवा ध्यान',
+        'झोपण्यापूर्वी कृतज्ञता सराव'
+    )
+}
@@ -3,21 +3,31 @@ Personal Family Use - Lunar Phase Calculations and Guidance
 """
 
 import ephem
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Any, Mapping, Optional, Sequence, Tuple
 import math
-import logging
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+# Numba compiles the batch phase kernel for large arrays when it is installed
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from src.utils.logging_setup import get_logger
-from src.utils.multi_language import multi_lang
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MoonPhaseInfo:
-    """Moon phase information."""
+    """Moon phase information (the text fields reference the shared phase tables)."""
     phase_name: str
     illumination: float
     age: float
@@ -26,211 +36,319 @@ class MoonPhaseInfo:
     next_new_moon: datetime
     rise_time: datetime
     set_time: datetime
-    guidance: Dict[str, str]
-    activities: Dict[str, List[str]]
-    remedies: Dict[str, List[str]]
+    guidance: Mapping[str, str]
+    activities: Mapping[str, Tuple[str, ...]]
+    remedies: Mapping[str, Tuple[str, ...]]
 
 
-# Removed duplicate MoonPhaseEngine class definition
-        
-        # Zodiac signs
-        self.zodiac_signs = {
-            'en': [
-                'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-            ],
-            'mr': [
-                'मेष', 'वृषभ', 'मिथुन', 'कर्क', 'सिंह', 'कन्या',
-                'तुला', 'वृश्चिक', 'धनु', 'मकर', 'कुंभ', 'मीन'
-            ]
-        }
-        
-        # Moon phase guidance
-        self.phase_guidance = {
-            'New Moon': {
-                'en': 'Time for new beginnings and setting intentions. Plant seeds for future growth.',
-                'mr': 'नवीन सुरुवात आणि हेतू ठरवण्याची वेळ. भविष्यातील वाढीसाठी बीज पेरा.'
-            },
-            'Waxing Crescent': {
-                'en': 'Time to take action on intentions. Focus on growth and building momentum.',
-                'mr': 'हेतूंवर कृती करण्याची वेळ. वाढ आणि गती निर्माण करण्यावर लक्ष केंद्रित करा.'
-            },
-            'First Quarter': {
-                'en': 'Time to overcome challenges. Make decisions and adjustments to your plans.',
-                'mr': 'आव्हाने दूर करण्याची वेळ. तुमच्या योजनांमध्ये निर्णय आणि समायोजन करा.'
-            },
-            'Waxing Gibbous': {
-                'en': 'Time for refinement and improvement. Focus on details and perfecting your work.',
-                'mr': 'परिष्करण आणि सुधारणेची वेळ. तपशील आणि तुमचे काम परिपूर्ण करण्यावर लक्ष केंद्रित करा.'
-            },
-            'Full Moon': {
-                'en': 'Time for culmination and manifestation. Celebrate achievements and release what no longer serves you.',
-                'mr': 'परिणती आणि प्रकटीकरणाची वेळ. यश साजरे करा आणि जे आता उपयोगी नाही ते सोडून द्या.'
-            },
-            'Waning Gibbous': {
-                'en': 'Time for gratitude and sharing. Express thanks and share your wisdom with others.',
-                'mr': 'कृतज्ञता आणि सामायिक करण्याची वेळ. आभार व्यक्त करा आणि तुमचे ज्ञान इतरांसह सामायिक करा.'
-            },
-            'Last Quarter': {
-                'en': 'Time for reflection and forgiveness. Let go of what no longer serves you.',
-                'mr': 'चिंतन आणि क्षमेची वेळ. जे आता उपयोगी नाही ते सोडून द्या.'
-            },
-            'Waning Crescent': {
-                'en': 'Time for rest and surrender. Prepare for the new cycle by clearing space.',
-                'mr': 'विश्रांती आणि समर्पणाची वेळ. जागा साफ करून नवीन चक्रासाठी तयार व्हा.'
-            }
-        }
-        
-        # Moon phase activities
-        self.phase_activities = {
-            'New Moon': {
-                'en': [
-                    'Set new intentions and goals',
-                    'Start new projects',
-                    'Plant seeds (literal and metaphorical)',
-                    'Meditate on new beginnings',
-                    'Create vision boards'
-                ],
-                'mr': [
-                    'नवीन हेतू आणि ध्येय ठरवा',
-                    'नवीन प्रकल्प सुरू करा',
-                    'बीज पेरा (शाब्दिक आणि प्रतीकात्मक)',
-                    'नवीन सुरुवातीवर ध्यान करा',
-                    'व्हिजन बोर्ड तयार करा'
-                ]
-            },
-            'Full Moon': {
-                'en': [
-                    'Celebrate achievements',
-                    'Release what no longer serves you',
-                    'Charge crystals in moonlight',
-                    'Practice gratitude rituals',
-                    'Perform family ceremonies'
-                ],
-                'mr': [
-                    'यश साजरे करा',
-                    'जे आता उपयोगी नाही ते सोडून द्या',
-                    'चंद्रप्रकाशात स्फटिक चार्ज करा',
-                    'कृतज्ञता विधी करा',
-                    'कौटुंबिक समारंभ करा'
-                ]
-            }
-        }
-        
-        # Moon phase remedies
-        self.phase_remedies = {
-            'New Moon': {
-                'en': [
-                    'Light a white candle',
-                    'Write down intentions',
-                    'Drink moon-charged water',
-                    'Wear silver jewelry',
-                    'Offer rice to deities'
-                ],
-                'mr': [
-                    'पांढरी मेणबत्ती लावा',
-                    'हेतू लिहून ठेवा',
-                    'चंद्र-चार्ज केलेले पाणी प्या',
-                    'चांदीचे दागिने घाला',
-                    'देवतांना तांदूळ अर्पण करा'
-                ]
-            },
-            'Full Moon': {
-                'en': [
-                    'Take a ritual bath with salt',
-                    'Meditate under the moonlight',
-                    'Perform cleansing rituals',
-                    'Chant moon mantras',
-                    'Offer milk to deities'
-                ],
-                'mr': [
-                    'मिठासह विधी स्नान करा',
-                    'चंद्रप्रकाशात ध्यान करा',
-                    'शुद्धीकरण विधी करा',
-                    'चंद्र मंत्र जपा',
-                    'देवतांना दूध अर्पण करा'
-                ]
-            }
-        }
-        
-    def get_current_moon_phase(self, date: datetime = None, language: str = 'en') -> MoonPhaseInfo:
-        """Get current moon phase information."""
-        if date is None:
-            date = datetime.now()
-        
-        # Set observer date
-        self.observer.date = date
-        
-        # Calculate moon phase
-        moon_phase = MoonPhase.from_date(date)
-        
-        # Calculate moon rise and set times
-        self.moon.compute(self.observer)
-        rise_time = self.observer.next_rising(self.moon).datetime()
-        set_time = self.observer.next_setting(self.moon).datetime()
-        
-        # Calculate moon sign
-        moon_sign_index = int(math.degrees(self.moon.hlon) / 30) % 12
-        moon_sign = self.zodiac_signs[language][moon_sign_index]
-        
-        # Get guidance for this phase
-        guidance = {
-            'en': self.phase_guidance.get(moon_phase.phase_name, {}).get('en', ''),
-            'mr': self.phase_guidance.get(moon_phase.phase_name, {}).get('mr', '')
-        }
-        
-        # Get activities for this phase
-        if moon_phase.phase_name in self.phase_activities:
-            activities = self.phase_activities[moon_phase.phase_name]
-        elif 'Full Moon' in self.phase_activities and 'Full' in moon_phase.phase_name:
-            activities = self.phase_activities['Full Moon']
-        elif 'New Moon' in self.phase_activities and 'New' in moon_phase.phase_name:
-            activities = self.phase_activities['New Moon']
-        else:
-            activities = {
-                'en': ['Meditate', 'Practice yoga', 'Spend time with family', 'Connect with nature', 'Journal'],
-                'mr': ['ध्यान करा', 'योग सराव करा', 'कुटुंबासोबत वेळ घालवा', 'निसर्गाशी जोडा', 'जर्नल लिहा']
-            }
-        
-        # Get remedies for this phase
-        if moon_phase.phase_name in self.phase_remedies:
-            remedies = self.phase_remedies[moon_phase.phase_name]
-        elif 'Full Moon' in self.phase_remedies and 'Full' in moon_phase.phase_name:
-            remedies = self.phase_remedies['Full Moon']
-        elif 'New Moon' in self.phase_remedies and 'New' in moon_phase.phase_name:
-            remedies = self.phase_remedies['New Moon']
-        else:
-            remedies = {
-                'en': ['Drink moon-charged water', 'Wear silver', 'Meditate', 'Chant mantras', 'Offer prayers'],
-                'mr': ['चंद्र-चार्ज केलेले पाणी प्या', 'चांदी घाला', 'ध्यान करा', 'मंत्र जपा', 'प्रार्थना अर्पण करा']
-            }
-        
-        # Create and return moon phase info
-        return MoonPhaseInfo(
-            phase_name=self.phase_names[language][self.phase_names['en'].index(moon_phase.phase_name)],
-            illumination=moon_phase.illumination,
-            age=moon_phase.age,
-            moon_sign=moon_sign,
-            next_full_moon=moon_phase.next_full,
-            next_new_moon=moon_phase.next_new,
-            rise_time=rise_time,
-            set_time=set_time,
-            guidance=guidance,
-            activities=activities,
-            remedies=remedies
-        )
+# English moon phase names; the Marathi tables live in moon_phase_engine_mr
+# and are imported on first use
+_PHASE_NAMES_EN = (
+    'New Moon', 'Waxing Crescent', 'First Quarter',
+    'Waxing Gibbous', 'Full Moon', 'Waning Gibbous',
+    'Last Quarter', 'Waning Crescent'
+)
+
+# Zodiac signs
+_ZODIAC_SIGNS_EN = (
+    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+)
+
+# Moon phase guidance
+_PHASE_GUIDANCE_EN = {
+    'New Moon': 'Time for new beginnings and setting intentions. Plant seeds for future growth.',
+    'Waxing Crescent': 'Time to take action on intentions. Focus on growth and building momentum.',
+    'First Quarter': 'Time to overcome challenges. Make decisions and adjustments to your plans.',
+    'Waxing Gibbous': 'Time for refinement and improvement. Focus on details and perfecting your work.',
+    'Full Moon': 'Time for culmination and manifestation. Celebrate achievements and release what no longer serves you.',
+    'Waning Gibbous': 'Time for gratitude and sharing. Express thanks and share your wisdom with others.',
+    'Last Quarter': 'Time for reflection and forgiveness. Let go of what no longer serves you.',
+    'Waning Crescent': 'Time for rest and surrender. Prepare for the new cycle by clearing space.'
+}
+
+# Moon phase activities
+_PHASE_ACTIVITIES_EN = {
+    'New Moon': (
+        'Set new intentions and goals',
+        'Start new projects',
+        'Plant seeds (literal and metaphorical)',
+        'Meditate on new beginnings',
+        'Create vision boards'
+    ),
+    'Full Moon': (
+        'Celebrate achievements',
+        'Release what no longer serves you',
+        'Charge crystals in moonlight',
+        'Practice gratitude rituals',
+        'Perform family ceremonies'
+    )
+}
+
+# Moon phase remedies
+_PHASE_REMEDIES_EN = {
+    'New Moon': (
+        'Light a white candle',
+        'Write down intentions',
+        'Drink moon-charged water',
+        'Wear silver jewelry',
+        'Offer rice to deities'
+    ),
+    'Full Moon': (
+        'Take a ritual bath with salt',
+        'Meditate under the moonlight',
+        'Perform cleansing rituals',
+        'Chant moon mantras',
+        'Offer milk to deities'
+    )
+}
+
+# Activities and remedies for phases without their own entry
+_DEFAULT_ACTIVITIES_EN = ('Meditate', 'Practice yoga', 'Spend time with family', 'Connect with nature', 'Journal')
+_DEFAULT_REMEDIES_EN = ('Drink moon-charged water', 'Wear silver', 'Meditate', 'Chant mantras', 'Offer prayers')
+
+# Languages every bilingual table answers for
+_LANGUAGES = ('en', 'mr')
+
+
+@lru_cache(maxsize=1)
+def _marathi_tables():
+    """Import the Marathi moon phase text on first use."""
+    from src.astrology import moon_phase_engine_mr
+    return moon_phase_engine_mr
+
+
+class _Translations(Mapping):
+    """English and Marathi values of one table entry; the Marathi side is imported on first access."""
     
-    def set_location(self, latitude: str, longitude: str, elevation: float = 0):
-        """Set observer location."""
-        try:
-            self.observer.lat = latitude
-            self.observer.lon = longitude
-            self.observer.elevation = elevation
-            logger.info(f"Location set to lat: {latitude}, lon: {longitude}, elev: {elevation}")
-            return True
-        except Exception as e:
-            logger.error(f"Error setting location: {e}")
-            return False
+    __slots__ = ('_english', '_marathi_table', '_marathi_key')
+    
+    def __init__(self, english: Any, marathi_table: str, marathi_key: Optional[str] = None):
+        self._english = english
+        self._marathi_table = marathi_table
+        self._marathi_key = marathi_key
+    
+    def __getitem__(self, language: str) -> Any:
+        if language == 'en':
+            return self._english
+        if language == 'mr':
+            marathi = getattr(_marathi_tables(), self._marathi_table)
+            return marathi if self._marathi_key is None else marathi[self._marathi_key]
+        raise KeyError(language)
+    
+    def __contains__(self, language: object) -> bool:
+        return language in _LANGUAGES
+    
+    def __iter__(self):
+        return iter(_LANGUAGES)
+    
+    def __len__(self) -> int:
+        return len(_LANGUAGES)
+    
+    def __repr__(self) -> str:
+        # Render like the plain dicts this replaced, without forcing the Marathi import
+        if _marathi_tables.cache_info().currsize:
+            return repr(dict(self))
+        return f"{{'en': {self._english!r}, 'mr': <not loaded>}}"
+
+
+# Bilingual views over the tables above
+_PHASE_NAMES = _Translations(_PHASE_NAMES_EN, 'PHASE_NAMES_MR')
+_ZODIAC_SIGNS = _Translations(_ZODIAC_SIGNS_EN, 'ZODIAC_SIGNS_MR')
+_PHASE_GUIDANCE = {
+    phase: _Translations(text, 'PHASE_GUIDANCE_MR', phase) for phase, text in _PHASE_GUIDANCE_EN.items()
+}
+_PHASE_ACTIVITIES = {
+    phase: _Translations(items, 'PHASE_ACTIVITIES_MR', phase) for phase, items in _PHASE_ACTIVITIES_EN.items()
+}
+_PHASE_REMEDIES = {
+    phase: _Translations(items, 'PHASE_REMEDIES_MR', phase) for phase, items in _PHASE_REMEDIES_EN.items()
+}
+_DEFAULT_ACTIVITIES = _Translations(_DEFAULT_ACTIVITIES_EN, 'DEFAULT_ACTIVITIES_MR')
+_DEFAULT_REMEDIES = _Translations(_DEFAULT_REMEDIES_EN, 'DEFAULT_REMEDIES_MR')
+
+# Hashed lookups for the English phase names used on every request
+_PHASE_INDEX = {name: i for i, name in enumerate(_PHASE_NAMES_EN)}
+
+
+@lru_cache(maxsize=None)
+def _language_tables(language: str) -> Tuple[Dict[str, str], Tuple[str, ...]]:
+    """(English phase name -> localized name, zodiac signs) for a language."""
+    names = _PHASE_NAMES[language]
+    return {name: names[i] for name, i in _PHASE_INDEX.items()}, _ZODIAC_SIGNS[language]
+
+
+# Full and New moon variants share the Full Moon / New Moon activities and remedies
+_PHASE_BUCKET = {
+    name: 'Full Moon' if 'Full' in name else 'New Moon' if 'New' in name else name
+    for name in _PHASE_NAMES_EN
+}
+
+# Mean synodic month, for turning the batch phase angle into an age
+_SYNODIC_MONTH = 29.530588853
+_UNIX_EPOCH_JD = 2440587.5
+
+# Phase angle (degrees past new moon) boundaries and the phase in each segment;
+# the exact phases get a two degree window around their angle
+_PHASE_ANGLE_BOUNDARIES = (1.0, 89.0, 91.0, 179.0, 181.0, 269.0, 271.0, 359.0)
+_PHASE_BY_SEGMENT = (
+    'New Moon', 'Waxing Crescent', 'First Quarter', 'Waxing Gibbous', 'Full Moon',
+    'Waning Gibbous', 'Last Quarter', 'Waning Crescent', 'New Moon'
+)
+
+# Low-precision sun-moon elongation for the batch API (Meeus, Astronomical
+# Algorithms ch. 48): the mean elongation D, sun anomaly M and moon anomaly M'
+# as degrees per Julian century from J2000, plus the largest periodic terms.
+# Good to a fraction of a degree, i.e. well under an hour of lunar motion.
+_J2000_JD = 2451545.0
+_DAYS_PER_CENTURY = 36525.0
+_ELONGATION_D0, _ELONGATION_D1 = 297.8501921, 445267.1114034
+_SUN_ANOMALY_0, _SUN_ANOMALY_1 = 357.5291092, 35999.0502909
+_MOON_ANOMALY_0, _MOON_ANOMALY_1 = 134.9633964, 477198.8675055
+
+# The exact phases and their angles; a batch sample takes the exact phase
+# when that angle is crossed within the time the sample stands for
+_EXACT_PHASES = (('New Moon', 0.0), ('First Quarter', 90.0), ('Full Moon', 180.0), ('Last Quarter', 270.0))
+
+# Arrays shorter than this use NumPy; compiling the kernel is not worth it
+_NUMBA_MIN_SIZE = 4096
+
+
+def _phase_kernel_numpy(julian_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Phase angle, illumination and age for an array of Julian days."""
+    t = (julian_days - _J2000_JD) / _DAYS_PER_CENTURY
+    d = np.radians(_ELONGATION_D0 + _ELONGATION_D1 * t)
+    m = np.radians(_SUN_ANOMALY_0 + _SUN_ANOMALY_1 * t)
+    mp = np.radians(_MOON_ANOMALY_0 + _MOON_ANOMALY_1 * t)
+    angle = np.mod(
+        np.degrees(d) + 6.289 * np.sin(mp) - 2.100 * np.sin(m) + 1.274 * np.sin(2.0 * d - mp)
+        + 0.658 * np.sin(2.0 * d) + 0.214 * np.sin(2.0 * mp) + 0.110 * np.sin(d),
+        360.0
+    )
+    illumination = (1.0 - np.cos(np.radians(angle))) / 2.0
+    age = angle * (_SYNODIC_MONTH / 360.0)
+    return angle, illumination, age
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _phase_kernel_numba(julian_days):
+        """Compiled version of _phase_kernel_numpy for a 1-D array."""
+        n = julian_days.shape[0]
+        angle = np.empty(n)
+        illumination = np.empty(n)
+        age = np.empty(n)
+        for i in numba.prange(n):
+            t = (julian_days[i] - _J2000_JD) / _DAYS_PER_CENTURY
+            d = math.radians(_ELONGATION_D0 + _ELONGATION_D1 * t)
+            m = math.radians(_SUN_ANOMALY_0 + _SUN_ANOMALY_1 * t)
+            mp = math.radians(_MOON_ANOMALY_0 + _MOON_ANOMALY_1 * t)
+            value = (
+                math.degrees(d) + 6.289 * math.sin(mp) - 2.100 * math.sin(m) + 1.274 * math.sin(2.0 * d - mp)
+                + 0.658 * math.sin(2.0 * d) + 0.214 * math.sin(2.0 * mp) + 0.110 * math.sin(d)
+            ) % 360.0
+            angle[i] = value
+            illumination[i] = 0.5 * (1.0 - math.cos(math.radians(value)))
+            age[i] = value * (_SYNODIC_MONTH / 360.0)
+        return angle, illumination, age
+
+
+def _phase_kernel(julian_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Phase kernel, compiled for large arrays when Numba is available."""
+    if NUMBA_AVAILABLE and julian_days.shape[0] >= _NUMBA_MIN_SIZE:
+        return _phase_kernel_numba(julian_days)
+    return _phase_kernel_numpy(julian_days)
+
+
+# The moon's phase barely changes within a few minutes, so moon state is
+# computed for the nearest quarter hour and shared between requests
+_QUARTER_HOUR = timedelta(minutes=15)
+
+
+def _round_to_quarter_hour(date: datetime) -> datetime:
+    """Round a datetime to the nearest quarter hour."""
+    seconds = date.minute * 60 + date.second
+    return date.replace(minute=0, second=0, microsecond=0) + _QUARTER_HOUR * ((seconds + 450) // 900)
+
+
+# Auspicious windows: after sunrise while waxing, before sunset while waning
+_WAXING_WINDOW = timedelta(hours=4)
+_WANING_WINDOW = timedelta(hours=2)
+
+
+def _format_time(value: datetime) -> str:
+    """Format a time as 'HH:MM AM/PM' without going through strftime."""
+    hour = value.hour
+    return f"{hour % 12 or 12:02d}:{value.minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+# One moon body reused for phase calculations; ephem bodies hold state, so
+# compute-and-read happens under a lock
+_MOON = ephem.Moon()
+_MOON_LOCK = threading.Lock()
+
+# Zodiac signs per radian of longitude (30 degrees each), so a sign index is one multiply
+_SIGNS_PER_RADIAN = 6.0 / math.pi
+
+# Beyond this latitude the moon (declination up to about 28.6 degrees) or the
+# sun can stay above or below the horizon all day, so rise/set may not exist
+_CIRCUMPOLAR_LATITUDE = 61.0
+
+# Rise/set results and moon phase answers kept per engine (oldest entries are evicted first)
+_RISE_SET_CACHE_SIZE = 64
+_PHASE_INFO_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=256)
+def _next_full_and_new(hour: datetime) -> Tuple[datetime, datetime]:
+    """Next full and new moon after the given hour."""
+    return ephem.next_full_moon(hour).datetime(), ephem.next_new_moon(hour).datetime()
+
+
+@lru_cache(maxsize=256)
+def _previous_new_moon(hour: datetime) -> datetime:
+    """Last new moon before the given hour."""
+    return ephem.previous_new_moon(hour).datetime()
+
+
+@lru_cache(maxsize=512)
+def _moon_phase_fields(date: datetime) -> Tuple[str, float, float, float, datetime, datetime]:
+    """Phase name, illumination, age, angle, next full and next new moon for a rounded instant."""
+    # Calculate illumination (0-1) and the phase angle from the signed
+    # sun-moon elongation (positive east of the sun, i.e. waxing)
+    with _MOON_LOCK:
+        _MOON.compute(date)
+        illumination = _MOON.phase / 100.0
+        moon_phase_angle = math.degrees(_MOON.elong) % 360.0
+    
+    # The surrounding new and full moons shift slowly, so they are cached per hour
+    hour = date.replace(minute=0)
+    previous_new_moon = _previous_new_moon(hour)
+    next_full_moon, next_new_moon = _next_full_and_new(hour)
+    if next_full_moon <= date or next_new_moon <= date:
+        # One of them fell between the hour and this instant
+        if next_new_moon <= date:
+            previous_new_moon = next_new_moon
+        next_full_moon, next_new_moon = _next_full_and_new(date)
+    
+    # Calculate moon age (0-29.53 days)
+    moon_age = (date - previous_new_moon).total_seconds() / 86400.0
+    
+    # Determine phase name based on angle
+    phase_name = _PHASE_BY_SEGMENT[bisect_right(_PHASE_ANGLE_BOUNDARIES, moon_phase_angle)]
+    
+    return phase_name, illumination, moon_age, moon_phase_angle, next_full_moon, next_new_moon
+
+
+@dataclass
+class MoonPhaseBatch:
+    """Approximate moon phases for a series of instants."""
+    times: np.ndarray
+    angle: np.ndarray
+    illumination: np.ndarray
+    age: np.ndarray
+    phase_name: np.ndarray
+
 
 @dataclass
 class MoonPhase:
@@ -244,60 +362,29 @@ class MoonPhase:
     
     @classmethod
     def from_date(cls, date: datetime = None):
-        """Calculate moon phase for a given date."""
+        """Calculate moon phase for a given date (to the nearest quarter hour)."""
         if date is None:
             date = datetime.now()
-            
-        moon = ephem.Moon(date)
-        sun = ephem.Sun(date)
-        
-        # Calculate moon phase angle
-        moon_phase_angle = moon.phase
-        
-        # Calculate illumination (0-1)
-        illumination = moon.phase / 100.0
         
-        # Calculate moon age (0-29.53 days)
-        previous_new_moon = ephem.previous_new_moon(date)
-        moon_age = (date - previous_new_moon.datetime()).total_seconds() / 86400.0
-        
-        # Calculate next full and new moons
-        next_full_moon = ephem.next_full_moon(date)
-        next_new_moon = ephem.next_new_moon(date)
-        
-        # Determine phase name based on angle
-        if moon_phase_angle < 1.0:
-            phase_name = "New Moon"
-        elif moon_phase_angle < 90.0:
-            phase_name = "Waxing Crescent"
-        elif abs(moon_phase_angle - 90.0) < 1.0:
-            phase_name = "First Quarter"
-        elif moon_phase_angle < 180.0:
-            phase_name = "Waxing Gibbous"
-        elif abs(moon_phase_angle - 180.0) < 1.0:
-            phase_name = "Full Moon"
-        elif moon_phase_angle < 270.0:
-            phase_name = "Waning Gibbous"
-        elif abs(moon_phase_angle - 270.0) < 1.0:
-            phase_name = "Last Quarter"
-        else:
-            phase_name = "Waning Crescent"
-        
-        return cls(
-            phase_name=phase_name,
-            illumination=illumination,
-            age=moon_age,
-            angle=moon_phase_angle,
-            next_full=next_full_moon.datetime(),
-            next_new=next_new_moon.datetime()
-        )
-    
-    
+        return cls(*_moon_phase_fields(_round_to_quarter_hour(date)))
+
+
+@dataclass(frozen=True, slots=True)
+class MoonState:
+    """Language-independent moon state for one instant."""
+    moon_phase: MoonPhase
+    rise_set: Optional[Tuple[datetime, datetime]]
+    moon_sign_index: int
 
 
 class MoonPhaseEngine:
     """Engine for moon phase calculations and guidance."""
     
+    __slots__ = (
+        'moon', 'sun', 'observer', '_is_polar', '_rise_set_cache', '_phase_info_cache', '_lock',
+        'phase_names', 'zodiac_signs', 'phase_guidance', 'phase_activities', 'phase_remedies'
+    )
+    
     def __init__(self):
         self.moon = ephem.Moon()
         self.sun = ephem.Sun()
@@ -307,201 +394,82 @@ class MoonPhaseEngine:
         self.observer.lat = '19.0760'  # North
         self.observer.lon = '72.8777'  # East
         self.observer.elevation = 14  # meters
-        
-        # Moon phase names
-        self.phase_names = {
-            'en': [
-                'New Moon', 'Waxing Crescent', 'First Quarter', 
-                'Waxing Gibbous', 'Full Moon', 'Waning Gibbous', 
-                'Last Quarter', 'Waning Crescent'
-            ],
-            'mr': [
-                'अमावस्या', 'शुक्ल पक्ष (वाढता चंद्र)', 'शुक्ल पक्ष (प्रथम चतुर्थी)', 
-                'शुक्ल पक्ष (वाढता चंद्र)', 'पौर्णिमा', 'कृष्ण पक्ष (कमी होणारा चंद्र)', 
-                'कृष्ण पक्ष (अंतिम चतुर्थी)', 'कृष्ण पक्ष (कमी होणारा चंद्र)'
-            ]
-        }
-        
-        # Zodiac signs
-        self.zodiac_signs = {
-            'en': [
-                'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-            ],
-            'mr': [
-                'मेष', 'वृषभ', 'मिथुन', 'कर्क', 'सिंह', 'कन्या',
-                'तुला', 'वृश्चिक', 'धनु', 'मकर', 'कुंभ', 'मीन'
-            ]
-        }
-        
-        # Moon phase guidance
-        self.phase_guidance = {
-            'New Moon': {
-                'en': 'Time for new beginnings and setting intentions. Plant seeds for future growth.',
-                'mr': 'नवीन सुरुवात आणि हेतू ठरवण्याची वेळ. भविष्यातील वाढीसाठी बीज पेरा.'
-            },
-            'Waxing Crescent': {
-                'en': 'Time to take action on intentions. Focus on growth and building momentum.',
-                'mr': 'हेतूंवर कृती करण्याची वेळ. वाढ आणि गती निर्माण करण्यावर लक्ष केंद्रित करा.'
-            },
-            'First Quarter': {
-                'en': 'Time to overcome challenges. Make decisions and adjustments to your plans.',
-                'mr': 'आव्हाने दूर करण्याची वेळ. तुमच्या योजनांमध्ये निर्णय आणि समायोजन करा.'
-            },
-            'Waxing Gibbous': {
-                'en': 'Time for refinement and improvement. Focus on details and perfecting your work.',
-                'mr': 'परिष्करण आणि सुधारणेची वेळ. तपशील आणि तुमचे काम परिपूर्ण करण्यावर लक्ष केंद्रित करा.'
-            },
-            'Full Moon': {
-                'en': 'Time for culmination and manifestation. Celebrate achievements and release what no longer serves you.',
-                'mr': 'परिणती आणि प्रकटीकरणाची वेळ. यश साजरे करा आणि जे आता उपयोगी नाही ते सोडून द्या.'
-            },
-            'Waning Gibbous': {
-                'en': 'Time for gratitude and sharing. Express thanks and share your wisdom with others.',
-                'mr': 'कृतज्ञता आणि सामायिक करण्याची वेळ. आभार व्यक्त करा आणि तुमचे ज्ञान इतरांसह सामायिक करा.'
-            },
-            'Last Quarter': {
-                'en': 'Time for reflection and forgiveness. Let go of what no longer serves you.',
-                'mr': 'चिंतन आणि क्षमेची वेळ. जे आता उपयोगी नाही ते सोडून द्या.'
-            },
-            'Waning Crescent': {
-                'en': 'Time for rest and surrender. Prepare for the new cycle by clearing space.',
-                'mr': 'विश्रांती आणि समर्पणाची वेळ. जागा साफ करून नवीन चक्रासाठी तयार व्हा.'
-            }
-        }
-        
-        # Moon phase activities
-        self.phase_activities = {
-            'New Moon': {
-                'en': [
-                    'Set new intentions and goals',
-                    'Start new projects',
-                    'Plant seeds (literal and metaphorical)',
-                    'Meditate on new beginnings',
-                    'Create vision boards'
-                ],
-                'mr': [
-                    'नवीन हेतू आणि ध्येय ठरवा',
-                    'नवीन प्रकल्प सुरू करा',
-                    'बीज पेरा (शाब्दिक आणि प्रतीकात्मक)',
-                    'नवीन सुरुवातीवर ध्यान करा',
-                    'व्हिजन बोर्ड तयार करा'
-                ]
-            },
-            'Full Moon': {
-                'en': [
-                    'Celebrate achievements',
-                    'Release what no longer serves you',
-                    'Charge crystals in moonlight',
-                    'Practice gratitude rituals',
-                    'Perform family ceremonies'
-                ],
-                'mr': [
-                    'यश साजरे करा',
-                    'जे आता उपयोगी नाही ते सोडून द्या',
-                    'चंद्रप्रकाशात स्फटिक चार्ज करा',
-                    'कृतज्ञता विधी करा',
-                    'कौटुंबिक समारंभ करा'
-                ]
-            }
-        }
-        
-        # Moon phase remedies
-        self.phase_remedies = {
-            'New Moon': {
-                'en': [
-                    'Light a white candle',
-                    'Write down intentions',
-                    'Drink moon-charged water',
-                    'Wear silver jewelry',
-                    'Offer rice to deities'
-                ],
-                'mr': [
-                    'पांढरी मेणबत्ती लावा',
-                    'हेतू लिहून ठेवा',
-                    'चंद्र-चार्ज केलेले पाणी प्या',
-                    'चांदीचे दागिने घाला',
-                    'देवतांना तांदूळ अर्पण करा'
-                ]
-            },
-            'Full Moon': {
-                'en': [
-                    'Take a ritual bath with salt',
-                    'Meditate under the moonlight',
-                    'Perform cleansing rituals',
-                    'Chant moon mantras',
-                    'Offer milk to deities'
-                ],
-                'mr': [
-                    'मिठासह विधी स्नान करा',
-                    'चंद्रप्रकाशात ध्यान करा',
-                    'शुद्धीकरण विधी करा',
-                    'चंद्र मंत्र जपा',
-                    'देवतांना दूध अर्पण करा'
-                ]
-            }
-        }
+        self._is_polar = False
+        
+        # (body, lat, lon, elevation, quarter hour) -> (rise, set) or None
+        self._rise_set_cache: Dict[tuple, Optional[Tuple[datetime, datetime]]] = {}
+        # (language, lat, lon, elevation, quarter hour) -> MoonPhaseInfo
+        self._phase_info_cache: Dict[tuple, MoonPhaseInfo] = {}
+        
+        # The shared engine is used from several threads; the observer, the
+        # bodies and both caches are only touched while holding this lock
+        self._lock = threading.RLock()
+        
+        # Read-only tables shared by every engine instance
+        self.phase_names = _PHASE_NAMES
+        self.zodiac_signs = _ZODIAC_SIGNS
+        self.phase_guidance = _PHASE_GUIDANCE
+        self.phase_activities = _PHASE_ACTIVITIES
+        self.phase_remedies = _PHASE_REMEDIES
     
     def get_current_moon_phase(self, date: datetime = None, language: str = 'en') -> MoonPhaseInfo:
         """Get current moon phase information."""
         if date is None:
             date = datetime.now()
         
-        # Set observer date
-        self.observer.date = date
-        
+        # Answers are shared within a quarter hour, the same granularity as the
+        # phase and rise/set caches, so rise/set and next full/new stay current
+        when = _round_to_quarter_hour(date)
+        with self._lock:
+            key = (language, self.observer.lat, self.observer.lon, self.observer.elevation, when)
+            cache = self._phase_info_cache
+            info = cache.get(key)
+            if info is None:
+                info = self._localize_state(self._compute_moon_state(when), language)
+                if len(cache) >= _PHASE_INFO_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+                cache[key] = info
+            return info
+    
+    def _compute_moon_state(self, date: datetime) -> MoonState:
+        """Calculate the language-independent moon state for a date."""
         # Calculate moon phase
         moon_phase = MoonPhase.from_date(date)
         
-        # Calculate moon rise and set times
-        self.moon.compute(self.observer)
-        try:
-            rise_time = self.observer.next_rising(self.moon).datetime()
-            set_time = self.observer.next_setting(self.moon).datetime()
-        except (ephem.AlwaysUpError, ephem.NeverUpError) as e:
-            logger.warning(f"Moon rise/set calculation error: {e}")
-            rise_time = datetime.now()
-            set_time = datetime.now() + timedelta(hours=12)
-        
-        # Calculate moon sign
-        moon_sign_index = int(math.degrees(self.moon.hlon) / 30) % 12
-        moon_sign = self.zodiac_signs[language][moon_sign_index]
+        with self._lock:
+            # Calculate moon rise and set times
+            rise_set = self._rise_set(self.moon, 'Moon', date)
+            
+            # Calculate moon sign
+            self.observer.date = date
+            self.moon.compute(self.observer)
+            moon_sign_index = int(self.moon.hlon * _SIGNS_PER_RADIAN) % 12
         
-        # Get guidance for this phase
-        guidance = {
-            'en': self.phase_guidance.get(moon_phase.phase_name, {}).get('en', ''),
-            'mr': self.phase_guidance.get(moon_phase.phase_name, {}).get('mr', '')
-        }
+        return MoonState(moon_phase=moon_phase, rise_set=rise_set, moon_sign_index=moon_sign_index)
+    
+    def _localize_state(self, state: MoonState, language: str) -> MoonPhaseInfo:
+        """Build the moon phase info for a computed state in the requested language."""
+        moon_phase = state.moon_phase
         
-        # Get activities for this phase
-        if moon_phase.phase_name in self.phase_activities:
-            activities = self.phase_activities[moon_phase.phase_name]
-        elif 'Full Moon' in self.phase_activities and 'Full' in moon_phase.phase_name:
-            activities = self.phase_activities['Full Moon']
-        elif 'New Moon' in self.phase_activities and 'New' in moon_phase.phase_name:
-            activities = self.phase_activities['New Moon']
+        if state.rise_set is None:
+            rise_time = datetime.now()
+            set_time = datetime.now() + timedelta(hours=12)
         else:
-            activities = {
-                'en': ['Meditate', 'Practice yoga', 'Spend time with family', 'Connect with nature', 'Journal'],
-                'mr': ['ध्यान करा', 'योग सराव करा', 'कुटुंबासोबत वेळ घालवा', 'निसर्गाशी जोडा', 'जर्नल लिहा']
-            }
+            rise_time, set_time = state.rise_set
         
-        # Get remedies for this phase
-        if moon_phase.phase_name in self.phase_remedies:
-            remedies = self.phase_remedies[moon_phase.phase_name]
-        elif 'Full Moon' in self.phase_remedies and 'Full' in moon_phase.phase_name:
-            remedies = self.phase_remedies['Full Moon']
-        elif 'New Moon' in self.phase_remedies and 'New' in moon_phase.phase_name:
-            remedies = self.phase_remedies['New Moon']
-        else:
-            remedies = {
-                'en': ['Drink moon-charged water', 'Wear silver', 'Meditate', 'Chant mantras', 'Offer prayers'],
-                'mr': ['चंद्र-चार्ज केलेले पाणी प्या', 'चांदी घाला', 'ध्यान करा', 'मंत्र जपा', 'प्रार्थना अर्पण करा']
-            }
+        # One lookup picks every language-specific table
+        localized_phases, zodiac_signs = _language_tables(language)
+        moon_sign = zodiac_signs[state.moon_sign_index]
+        
+        # Get guidance, activities and remedies for this phase
+        guidance = self.phase_guidance[moon_phase.phase_name]
+        bucket = _PHASE_BUCKET[moon_phase.phase_name]
+        activities = self.phase_activities.get(bucket, _DEFAULT_ACTIVITIES)
+        remedies = self.phase_remedies.get(bucket, _DEFAULT_REMEDIES)
         
         # Create and return moon phase info
         return MoonPhaseInfo(
-            phase_name=self.phase_names[language][self.phase_names['en'].index(moon_phase.phase_name)],
+            phase_name=localized_phases[moon_phase.phase_name],
             illumination=moon_phase.illumination,
             age=moon_phase.age,
             moon_sign=moon_sign,
@@ -514,16 +482,96 @@ class MoonPhaseEngine:
             remedies=remedies
         )
     
+    def get_phases_batch(self, dates: Sequence[datetime]) -> MoonPhaseBatch:
+        """Approximate moon phases for many dates at once (accurate to within an hour).
+        
+        Each sample stands for the time halfway to its neighbours, so a daily
+        calendar labels the day nearest each exact phase (New, First Quarter,
+        Full, Last Quarter) even though the moon moves about 12 degrees a day.
+        """
+        # Naive datetimes are treated as UT, like ephem does
+        times = np.asarray(dates, dtype='datetime64[s]').reshape(-1)
+        julian_days = times.astype(np.float64) / 86400.0 + _UNIX_EPOCH_JD
+        
+        angle, illumination, age = _phase_kernel(julian_days)
+        phase_name = np.take(_PHASE_BY_SEGMENT, np.searchsorted(_PHASE_ANGLE_BOUNDARIES, angle, side='right'))
+        
+        if julian_days.shape[0] > 1:
+            # Half the gap to each neighbour (the end samples mirror their only
+            # neighbour); out-of-order or month-long gaps get no window
+            gaps = np.diff(julian_days)
+            half = np.where((gaps > 0.0) & (gaps < _SYNODIC_MONTH / 2.0), gaps / 2.0, 0.0)
+            start_angle = _phase_kernel(julian_days - np.concatenate((half[:1], half)))[0]
+            end_angle = _phase_kernel(julian_days + np.concatenate((half, half[-1:])))[0]
+            span = np.mod(end_angle - start_angle, 360.0)
+            
+            for name, exact_angle in _EXACT_PHASES:
+                crossed = np.mod(exact_angle - start_angle, 360.0) < span
+                phase_name = np.where(crossed, name, phase_name)
+        
+        return MoonPhaseBatch(
+            times=times,
+            angle=angle,
+            illumination=illumination,
+            age=age,
+            phase_name=phase_name
+        )
+    
+    def set_location(self, latitude: str, longitude: str, elevation: float = 0):
+        """Set observer location."""
+        try:
+            with self._lock:
+                self.observer.lat = latitude
+                self.observer.lon = longitude
+                self.observer.elevation = elevation
+                self._is_polar = abs(math.degrees(self.observer.lat)) > _CIRCUMPOLAR_LATITUDE
+            logger.info(f"Location set to lat: {latitude}, lon: {longitude}, elev: {elevation}")
+            return True
+        except Exception as e:
+            logger.error(f"Error setting location: {e}")
+            return False
+    
+    def _rise_set(self, body: ephem.Body, body_name: str, date: datetime) -> Optional[Tuple[datetime, datetime]]:
+        """Next rise and set of a body, cached per location and quarter hour (None if it never rises or sets)."""
+        when = _round_to_quarter_hour(date)
+        with self._lock:
+            key = (body_name, self.observer.lat, self.observer.lon, self.observer.elevation, when)
+            cache = self._rise_set_cache
+            if key in cache:
+                return cache[key]
+            
+            self.observer.date = when
+            if self._is_polar:
+                rise_set = self._polar_rise_set(body, body_name)
+            else:
+                rise_set = (
+                    self.observer.next_rising(body).datetime(),
+                    self.observer.next_setting(body).datetime()
+                )
+            
+            if len(cache) >= _RISE_SET_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = rise_set
+            return rise_set
+    
+    def _polar_rise_set(self, body: ephem.Body, body_name: str) -> Optional[Tuple[datetime, datetime]]:
+        """Rise and set at high latitudes, where a body can stay up or down all day."""
+        try:
+            return (
+                self.observer.next_rising(body).datetime(),
+                self.observer.next_setting(body).datetime()
+            )
+        except (ephem.AlwaysUpError, ephem.NeverUpError) as e:
+            logger.warning(f"{body_name} rise/set calculation error: {e}")
+            return None
+    
     def _calculate_next_full_and_new_moon(self, date: datetime) -> Tuple[datetime, datetime]:
         """Calculate next full and new moon dates."""
         try:
-            # Find next full moon
-            next_full = ephem.next_full_moon(date)
-            next_full_date = datetime.strptime(str(next_full), '%Y/%m/%d %H:%M:%S')
-            
-            # Find next new moon
-            next_new = ephem.next_new_moon(date)
-            next_new_date = datetime.strptime(str(next_new), '%Y/%m/%d %H:%M:%S')
+            # Shares the hourly cache used by MoonPhase.from_date
+            next_full_date, next_new_date = _next_full_and_new(date.replace(minute=0, second=0, microsecond=0))
+            if next_full_date <= date or next_new_date <= date:
+                next_full_date, next_new_date = _next_full_and_new(date)
             
             return next_full_date, next_new_date
             
@@ -610,51 +658,45 @@ class MoonPhaseEngine:
             if date is None:
                 date = datetime.now()
             
-            # Get current moon phase
-            moon_phase = MoonPhase.from_date(date)
+            # Moon phase, rise/set and sign in one pass, then sunrise and
+            # sunset, all for the same observer location
+            with self._lock:
+                state = self._compute_moon_state(date)
+                sun_rise_set = self._rise_set(self.sun, 'Sun', date)
+            moon_phase = state.moon_phase
             
-            # Set observer date
-            self.observer.date = date
-            
-            # Calculate sunrise and sunset
-            self.sun.compute(self.observer)
-            try:
-                sunrise = self.observer.next_rising(self.sun).datetime()
-                sunset = self.observer.next_setting(self.sun).datetime()
-            except (ephem.AlwaysUpError, ephem.NeverUpError) as e:
-                logger.warning(f"Sun rise/set calculation error: {e}")
+            if sun_rise_set is None:
                 # Use default times for polar regions
                 sunrise = date.replace(hour=6, minute=0, second=0, microsecond=0)
                 sunset = date.replace(hour=18, minute=0, second=0, microsecond=0)
+            else:
+                sunrise, sunset = sun_rise_set
             
-            # Calculate moon rise and set
-            self.moon.compute(self.observer)
-            try:
-                moonrise = self.observer.next_rising(self.moon).datetime()
-                moonset = self.observer.next_setting(self.moon).datetime()
-            except (ephem.AlwaysUpError, ephem.NeverUpError) as e:
-                logger.warning(f"Moon rise/set calculation error: {e}")
+            # Moon rise and set
+            if state.rise_set is None:
                 # Use default times for polar regions
                 moonrise = date.replace(hour=18, minute=0, second=0, microsecond=0)
                 moonset = date.replace(hour=6, minute=0, second=0, microsecond=0)
+            else:
+                moonrise, moonset = state.rise_set
                 
             # Get complete moon phase info
-            moon_info = self.get_current_moon_phase(date, language)
-            phase_index = self.phase_names['en'].index(moon_phase.phase_name)
+            moon_info = self._localize_state(state, language)
+            phase_index = _PHASE_INDEX[moon_phase.phase_name]
             
             # Format times
-            rise_time_str = moonrise.strftime('%I:%M %p')
-            set_time_str = moonset.strftime('%I:%M %p')
+            rise_time_str = _format_time(moonrise)
+            set_time_str = _format_time(moonset)
             
             # Morning hours are generally good for waxing moon (0-3)
             # Evening hours are generally good for waning moon (4-7)
             if phase_index < 4:  # Waxing moon
-                auspicious_start = sunrise.strftime('%I:%M %p')
-                auspicious_end = (sunrise + timedelta(hours=4)).strftime('%I:%M %p')
+                auspicious_start = _format_time(sunrise)
+                auspicious_end = _format_time(sunrise + _WAXING_WINDOW)
                 activity = "Starting new projects" if language == 'en' else "नवीन प्रकल्प सुरू करणे"
             else:  # Waning moon
-                auspicious_start = (sunset - timedelta(hours=2)).strftime('%I:%M %p')
-                auspicious_end = sunset.strftime('%I:%M %p')
+                auspicious_start = _format_time(sunset - _WANING_WINDOW)
+                auspicious_end = _format_time(sunset)
                 activity = "Reflection and meditation" if language == 'en' else "चिंतन आणि ध्यान"
             
             return {
@@ -664,7 +706,7 @@ class MoonPhaseEngine:
                 'auspicious_end': auspicious_end,
                 'activity': activity,
                 'best_time': f"{auspicious_start} - {auspicious_end}",
-                'activities': moon_info.activities[language][:3] if language in moon_info.activities else [],
+                'activities': list(moon_info.activities[language][:3]) if language in moon_info.activities else [],
                 'avoid_time': "4:00 PM - 8:00 PM" if phase_index < 4 else "6:00 AM - 10:00 AM"
             }
                 
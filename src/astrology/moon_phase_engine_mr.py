@@ -0,0 +1,63 @@
+"""
+Marathi text for the Moon Phase Engine
+Kept apart from the English tables and imported only when Marathi is requested
+"""
+
+PHASE_NAMES_MR = (
+    'अमावस्या', 'शुक्ल पक्ष (वाढता चंद्र)', 'शुक्ल पक्ष (प्रथम चतुर्थी)',
+    'शुक्ल पक्ष (वाढता चंद्र)', 'पौर्णिमा', 'कृष्ण पक्ष (कमी होणारा चंद्र)',
+    'कृष्ण पक्ष (अंतिम चतुर्थी)', 'कृष्ण पक्ष (कमी होणारा चंद्र)'
+)
+
+ZODIAC_SIGNS_MR = (
+    'मेष', 'वृषभ', 'मिथुन', 'कर्क', 'सिंह', 'कन्या',
+    'तुला', 'वृश्चिक', 'धनु', 'मकर', 'कुंभ', 'मीन'
+)
+
+PHASE_GUIDANCE_MR = {
+    'New Moon': 'नवीन सुरुवात आणि हेतू ठरवण्याची वेळ. भविष्यातील वाढीसाठी बीज पेरा.',
+    'Waxing Crescent': 'हेतूंवर कृती करण्याची वेळ. वाढ आणि गती निर्माण करण्यावर लक्ष केंद्रित करा.',
+    'First Quarter': 'आव्हाने दूर करण्याची वेळ. तुमच्या योजनांमध्ये निर्णय आणि समायोजन करा.',
+    'Waxing Gibbous': 'परिष्करण आणि सुधारणेची वेळ. तपशील आणि तुमचे काम परिपूर्ण करण्यावर लक्ष केंद्रित करा.',
+    'Full Moon': 'परिणती आणि प्रकटीकरणाची वेळ. यश साजरे करा आणि जे आता उपयोगी नाही ते सोडून द्या.',
+    'Waning Gibbous': 'कृतज्ञता आणि सामायिक करण्याची वेळ. आभार व्यक्त करा आणि तुमचे ज्ञान इतरांसह सामायिक करा.',
+    'Last Quarter': 'चिंतन आणि क्षमेची वेळ. जे आता उपयोगी नाही ते सोडून द्या.',
+    'Waning Crescent': 'विश्रांती आणि समर्पणाची वेळ. जागा साफ करून नवीन चक्रासाठी तयार व्हा.'
+}
+
+PHASE_ACTIVITIES_MR = {
+    'New Moon': (
+        'नवीन हेतू आणि ध्येय ठरवा',
+        'नवीन प्रकल्प सुरू करा',
+        'बीज पेरा (शाब्दिक आणि प्रतीकात्मक)',
+        'नवीन सुरुवातीवर ध्यान करा',
+        'व्हिजन बोर्ड तयार करा'
+    ),
+    'Full Moon': (
+        'यश साजरे करा',
+        'जे आता उपयोगी नाही ते सोडून द्या',
+        'चंद्रप्रकाशात स्फटिक चार्ज करा',
+        'कृतज्ञता विधी करा',
+        'कौटुंबिक समारंभ करा'
+    )
+}
+
+PHASE_REMEDIES_MR = {
+    'New Moon': (
+        'पांढरी मेणबत्ती लावा',
+        'हेतू लिहून ठेवा',
+        'चंद्र-चार्ज केलेले पाणी प्या',
+        'चांदीचे दागिने घाला',
+        'देवतांना तांदूळ अर्पण करा'
+    ),
+    'Full Moon': (
+        'मिठासह विधी स्नान करा',
+        'चंद्रप्रकाशात ध्यान करा',
+        'शुद्धीकरण विधी करा',
+        'चंद्र मंत्र जपा',
+        'देवतांना दूध अर्पण करा'
+    )
+}
+
+DEFAULT_ACTIVITIES_MR = ('ध्यान करा', 'योग सराव करा', 'कुटुंबासोबत वेळ घालवा', 'निसर्गाशी जोडा', 'जर्नल लिहा')
+DEFAULT_REMEDIES_MR = ('चंद्र-चार्ज केलेले पाणी प्या', 'चांदी घाला', 'ध्यान करा', 'मंत्र जपा', 'प्रार्थना अर्पण करा')
@@ -138,15 +138,9 @@ class SimpleAstrologyEngine:
     
     def _get_zodiac_sign(self, longitude: float) -> str:
         """Get zodiac sign from longitude."""
-        # Normalize longitude to 0-360
-        longitude = longitude % 360
-        
-        # Find the sign
-        for start_deg, sign_info in self.zodiac_signs.items():
-            if longitude >= start_deg and longitude < start_deg + 30:
-                return sign_info["name"]
-        
-        return "Aries"  # Default
+        # Normalize longitude to 0-360; signs are keyed by their 30° start
+        start_deg = int(longitude % 360 // 30) % 12 * 30
+        return self.zodiac_signs[start_deg]["name"]
     
     def _get_default_birth_chart(self, birth_date: str, birth_time: str, birth_place: str) -> Dict[str, Any]:
         """Get default birth chart when calculation fails."""
@@ -3,19 +3,72 @@ Unified Astrology Service combining Vedic, Numerology, and Lal Kitab
 """
 
 import json
+import os
+from bisect import bisect_left
+from itertools import combinations
 from datetime import datetime, date
 from typing import Dict, Any, Optional, List
 import swisseph as swe
 from loguru import logger
 from src.services.openrouter_service import openrouter_service
 
+# Swiss Ephemeris keeps its data path in process-wide state, so set it once at import
+swe.set_ephe_path(os.environ.get('SE_EPHE_PATH', '/usr/share/swisseph'))  # Render path
+
+# Swiss Ephemeris bodies computed per chart; Ketu is derived from Rahu
+_PLANET_IDS = (
+    ('Sun', swe.SUN),
+    ('Moon', swe.MOON),
+    ('Mercury', swe.MERCURY),
+    ('Venus', swe.VENUS),
+    ('Mars', swe.MARS),
+    ('Jupiter', swe.JUPITER),
+    ('Saturn', swe.SATURN),
+    ('Rahu', swe.MEAN_NODE),
+)
+
+# Major aspects as (name, exact angle); with an 8° orb at most one can match a pair
+_ASPECT_ORB = 8
+_ASPECT_ANGLES = (
+    ("Conjunction", 0),
+    ("Sextile", 60),
+    ("Square", 90),
+    ("Trine", 120),
+    ("Opposition", 180),
+)
+_ASPECT_DEGREES = tuple(angle for _, angle in _ASPECT_ANGLES)
+
+def _match_aspect(diff: float) -> Optional[str]:
+    """Return the major aspect within orb of an angular separation (0-180°), if any."""
+    i = bisect_left(_ASPECT_DEGREES, diff)
+    # Only the exact angles either side of the separation can be within orb
+    for j in (i - 1, i):
+        if 0 <= j < len(_ASPECT_DEGREES) and abs(diff - _ASPECT_DEGREES[j]) <= _ASPECT_ORB:
+            return _ASPECT_ANGLES[j][0]
+    return None
+
+# Numerology totals that are kept as-is instead of being reduced further
+_MASTER_NUMBERS = (11, 22, 33)
+
+def _digit_sum(n: int) -> int:
+    """Sum the decimal digits of a non-negative integer."""
+    total = 0
+    while n:
+        n, digit = divmod(n, 10)
+        total += digit
+    return total
+
+def _reduce_number(total: int) -> int:
+    """Reduce a total to a single digit, keeping the master numbers 11, 22 and 33."""
+    # The digital-root shortcut 1 + (n - 1) % 9 would skip past master numbers
+    while total > 9 and total not in _MASTER_NUMBERS:
+        total = _digit_sum(total)
+    return total
+
 class UnifiedAstrologyService:
     """Unified astrology service combining multiple systems."""
     
     def __init__(self):
-        # Initialize Swiss Ephemeris
-        swe.set_ephe_path('/usr/share/swisseph')  # Render path
-        
         # Zodiac signs
         self.zodiac_signs = [
             "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
@@ -70,42 +123,31 @@ class UnifiedAstrologyService:
     def _calculate_planetary_positions(self, jd: float) -> Dict[str, Any]:
         """Calculate planetary positions."""
         planets = {}
-        planet_ids = {
-            'Sun': swe.SUN,
-            'Moon': swe.MOON,
-            'Mercury': swe.MERCURY,
-            'Venus': swe.VENUS,
-            'Mars': swe.MARS,
-            'Jupiter': swe.JUPITER,
-            'Saturn': swe.SATURN,
-            'Rahu': swe.MEAN_NODE,
-            'Ketu': swe.MEAN_NODE  # Ketu is 180° opposite to Rahu
-        }
         
-        for planet_name, planet_id in planet_ids.items():
+        for planet_name, planet_id in _PLANET_IDS:
             try:
                 result = swe.calc_ut(jd, planet_id)
-                longitude = result[0][0]
-                
-                if planet_name == 'Ketu':
-                    longitude = (longitude + 180) % 360
-                
-                sign_num = int(longitude / 30)
-                sign = self.zodiac_signs[sign_num]
-                degree = longitude % 30
-                
-                planets[planet_name] = {
-                    'longitude': longitude,
-                    'sign': sign,
-                    'degree': degree,
-                    'sign_num': sign_num
-                }
+                planets[planet_name] = self._sign_position(result[0][0])
                 
             except Exception as e:
                 logger.error(f"Error calculating {planet_name}: {e}")
         
+        # Ketu is 180° opposite to Rahu, so it needs no ephemeris call of its own
+        if 'Rahu' in planets:
+            planets['Ketu'] = self._sign_position((planets['Rahu']['longitude'] + 180) % 360)
+        
         return planets
     
+    def _sign_position(self, longitude: float) -> Dict[str, Any]:
+        """Split an ecliptic longitude into its sign and degree within the sign."""
+        sign_num = int(longitude / 30)
+        return {
+            'longitude': longitude,
+            'sign': self.zodiac_signs[sign_num],
+            'degree': longitude % 30,
+            'sign_num': sign_num
+        }
+    
     def _calculate_houses(self, jd: float, latitude: float, longitude: float) -> Dict[str, Any]:
         """Calculate house positions."""
         try:
@@ -159,42 +201,23 @@ class UnifiedAstrologyService:
     def _calculate_aspects(self, planets: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Calculate planetary aspects."""
         aspects = []
-        planet_names = list(planets.keys())
+        longitudes = [(name, data['longitude']) for name, data in planets.items()]
         
-        for i, planet1 in enumerate(planet_names):
-            for planet2 in planet_names[i+1:]:
-                try:
-                    long1 = planets[planet1]['longitude']
-                    long2 = planets[planet2]['longitude']
-                    
-                    # Calculate angular difference
-                    diff = abs(long1 - long2)
-                    if diff > 180:
-                        diff = 360 - diff
-                    
-                    # Check for major aspects (with 8° orb)
-                    aspect_type = None
-                    if abs(diff - 0) <= 8:
-                        aspect_type = "Conjunction"
-                    elif abs(diff - 60) <= 8:
-                        aspect_type = "Sextile"
-                    elif abs(diff - 90) <= 8:
-                        aspect_type = "Square"
-                    elif abs(diff - 120) <= 8:
-                        aspect_type = "Trine"
-                    elif abs(diff - 180) <= 8:
-                        aspect_type = "Opposition"
-                    
-                    if aspect_type:
-                        aspects.append({
-                            'planet1': planet1,
-                            'planet2': planet2,
-                            'aspect': aspect_type,
-                            'orb': diff
-                        })
-                        
-                except Exception as e:
-                    logger.error(f"Error calculating aspect between {planet1} and {planet2}: {e}")
+        for (planet1, long1), (planet2, long2) in combinations(longitudes, 2):
+            # Calculate angular difference
+            diff = abs(long1 - long2)
+            if diff > 180:
+                diff = 360 - diff
+            
+            # Check for major aspects (with 8° orb)
+            aspect_type = _match_aspect(diff)
+            if aspect_type:
+                aspects.append({
+                    'planet1': planet1,
+                    'planet2': planet2,
+                    'aspect': aspect_type,
+                    'orb': diff
+                })
         
         return aspects
     
@@ -228,14 +251,10 @@ class UnifiedAstrologyService:
     def _calculate_life_path_number(self, birth_dt: datetime) -> int:
         """Calculate life path number from birth date."""
         # Sum all digits in birth date
-        date_str = birth_dt.strftime("%d%m%Y")
-        total = sum(int(digit) for digit in date_str)
+        total = _digit_sum(birth_dt.day) + _digit_sum(birth_dt.month) + _digit_sum(birth_dt.year)
         
         # Reduce to single digit (except master numbers 11, 22, 33)
-        while total > 9 and total not in [11, 22, 33]:
-            total = sum(int(digit) for digit in str(total))
-        
-        return total
+        return _reduce_number(total)
     
     def _calculate_destiny_number(self, full_name: str) -> int:
         """Calculate destiny number from full name."""
@@ -249,10 +268,7 @@ class UnifiedAstrologyService:
         total = sum(letter_values.get(char.upper(), 0) for char in full_name if char.isalpha())
         
         # Reduce to single digit
-        while total > 9 and total not in [11, 22, 33]:
-            total = sum(int(digit) for digit in str(total))
-        
-        return total
+        return _reduce_number(total)
     
     def _calculate_soul_number(self, full_name: str) -> int:
         """Calculate soul number from vowels in name."""
@@ -261,10 +277,7 @@ class UnifiedAstrologyService:
         total = sum(vowel_values.get(char.upper(), 0) for char in full_name if char.upper() in vowel_values)
         
         # Reduce to single digit
-        while total > 9 and total not in [11, 22, 33]:
-            total = sum(int(digit) for digit in str(total))
-        
-        return total
+        return _reduce_number(total)
     
     def generate_lal_kitab_analysis(self, birth_chart: Dict[str, Any]) -> Dict[str, Any]:
         """Generate Lal Kitab analysis."""
@@ -4,6 +4,7 @@ OpenRouter Service for Free LLM Integration
 
 import os
 import json
+import asyncio
 from typing import Dict, Any, Optional
 import httpx
 from loguru import logger
@@ -15,10 +16,34 @@ class OpenRouterService:
         self.api_key = os.environ.get('OPENROUTER_API_KEY')
         self.base_url = "https://openrouter.ai/api/v1"
         self.default_model = "meta-llama/llama-3.1-8b-instruct:free"  # Free model
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
         
         if not self.api_key:
             logger.warning("OPENROUTER_API_KEY not found. AI features will be limited.")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client so requests reuse pooled keep-alive connections."""
+        # Pooled connections belong to the loop that opened them, so callers on a
+        # new loop (asyncio.run, Flask async views) get a fresh client
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=75.0)
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client."""
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        
+        # A client from a loop that has since closed cannot be shut down cleanly
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.aclose()
+    
     async def generate_response(self, prompt: str, system_prompt: str = None, model: str = None) -> str:
         """Generate response using OpenRouter API."""
         if not self.api_key:
@@ -46,21 +71,21 @@ class OpenRouterService:
                 "temperature": 0.7
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=30.0
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=data,
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                return result["choices"][0]["message"]["content"]
+            else:
+                logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
+                return "Sorry, I couldn't generate a response at this time."
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    logger.error(f"OpenRouter API error: {response.status_code} - {response.text}")
-                    return "Sorry, I couldn't generate a response at this time."
-                    
         except Exception as e:
             logger.error(f"Error calling OpenRouter API: {e}")
             return "Sorry, there was an error generating your response."
@@ -76,20 +101,20 @@ class OpenRouterService:
                 "Content-Type": "application/json"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers=headers,
-                    timeout=10.0
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/models",
+                headers=headers,
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                return result.get("data", [])
+            else:
+                logger.error(f"Error fetching models: {response.status_code}")
+                return []
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    return result.get("data", [])
-                else:
-                    logger.error(f"Error fetching models: {response.status_code}")
-                    return []
-                    
         except Exception as e:
             logger.error(f"Error fetching available models: {e}")
             return []
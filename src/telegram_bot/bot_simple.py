@@ -1977,9 +1977,8 @@ Current planetary transits influence your:
             return
         
         try:
-            from src.astrology.moon_phase_engine import MoonPhaseEngine
-            moon_engine = MoonPhaseEngine()
-            moon_phase = moon_engine.get_current_moon_phase()
+            from src.astrology.moon_phase_engine import moon_phase_engine
+            moon_phase = moon_phase_engine.get_current_moon_phase()
             
             message = f"""🌙 **Moon Phase Guidance** - {datetime.now().strftime('%B %d, %Y')}
 
@@ -2014,8 +2013,7 @@ Current planetary transits influence your:
             return
         
         try:
-            from src.astrology.festival_calendar import FestivalCalendar
-            festival_calendar = FestivalCalendar()
+            from src.astrology.festival_calendar import festival_calendar
             upcoming_festivals = festival_calendar.get_upcoming_festivals(30)
             
             if not upcoming_festivals:
@@ -2061,8 +2059,7 @@ Current planetary transits influence your:
             return
         
         try:
-            from src.astrology.festival_calendar import FestivalCalendar
-            festival_calendar = FestivalCalendar()
+            from src.astrology.festival_calendar import festival_calendar
             auspicious_days = festival_calendar.get_auspicious_days(datetime.now(), 14)
             
             if not auspicious_days:
@@ -2114,7 +2111,7 @@ Current planetary transits influence your:
                 return
             
             # Get seasonal health tips
-            seasonal_tips = health_engine.get_seasonal_health_tips()
+            seasonal_tips = health_engine.get_seasonal_health_tips(language='en')
             current_season = seasonal_tips['en']
             
             # Get exercise timing
@@ -21,9 +21,13 @@ class FamilyTelegramBot:
     
     def __init__(self, token: str):
         self.token = token
-        self.application = Application.builder().token(token).build()
+        self.application = Application.builder().token(token).post_shutdown(self._close_services).build()
         self.setup_handlers()
     
+    async def _close_services(self, application: Application):
+        """Release shared service resources when the bot shuts down."""
+        await openrouter_service.close()
+    
     def setup_handlers(self):
         """Setup message handlers."""
         # Command handlers
@@ -27,7 +27,7 @@ class LoggingConfig(BaseSettings):
     
     log_level: str = Field(default="INFO", description="Logging level")
     log_file: str = Field(default="logs/simple_astro.log", description="Log file path")
-    log_rotation: str = Field(default="1 day", description="Log rotation interval")
+    log_rotation: str = Field(default="5 MB", description="Log rotation size")
     log_retention: str = Field(default="7 days", description="Log retention period")
     
     class Config:
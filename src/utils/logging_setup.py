@@ -3,6 +3,7 @@ Logging Setup for Astro AI Companion
 Personal Family Use - Structured Logging
 """
 
+import atexit
 import logging
 import sys
 from pathlib import Path
@@ -29,9 +30,10 @@ logger.add(
     "logs/astro_ai.log",
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     level="DEBUG",
-    rotation="1 day",
+    rotation="5 MB",
     retention="30 days",
-    compression="zip"
+    compression="zip",
+    enqueue=True
 )
 
 # Add error file handler
@@ -39,9 +41,10 @@ logger.add(
     "logs/errors.log",
     format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
     level="ERROR",
-    rotation="1 day",
+    rotation="5 MB",
     retention="30 days",
-    compression="zip"
+    compression="zip",
+    enqueue=True
 )
 
 
@@ -70,11 +73,15 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
             log_file,
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
             level="DEBUG",
-            rotation="1 day",
+            rotation="5 MB",
             retention="30 days",
-            compression="zip"
+            compression="zip",
+            enqueue=True
         )
 
 
 # Initialize logging
-setup_logging() 
\ No newline at end of file
+setup_logging()
+
+# Drain queued (enqueue=True) records before the interpreter exits
+atexit.register(logger.complete) 
\ No newline at end of file
@@ -1,6 +1,9 @@
 import requests
 from typing import Optional, Dict, Any, List, Tuple
 
+# Shared across clients so repeated calls reuse keep-alive connections
+_session = requests.Session()
+
 class OpenRouterClient:
     def __init__(self, api_key: str, host: str = 'https://openrouter.ai/api'):
         self.api_key = api_key
@@ -42,7 +45,7 @@ class OpenRouterClient:
             payload["context"] = context
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
+            response = _session.post(url, json=payload, headers=headers, timeout=60)
             response.raise_for_status()
             data = response.json()
             
@@ -69,7 +72,7 @@ class OpenRouterClient:
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _session.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -99,7 +102,7 @@ class OpenRouterClient:
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _session.get(url, headers=headers, timeout=10)
             
             # Check for authentication errors
             if response.status_code == 401 or response.status_code == 403:
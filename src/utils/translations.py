@@ -6,9 +6,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 translations_path = Path("config/languages/translations.yaml")
 with open(translations_path, 'r', encoding='utf-8') as f:
-    TRANSLATIONS = yaml.safe_load(f)
+    TRANSLATIONS = yaml.load(f, Loader=_YamlLoader)
 
 def get_translation(key: str, language: str = 'en') -> str:
     """Get translation for a key in specified language."""
@@ -16,8 +16,12 @@ from src.models.user_models import User, Family, BirthChart, Prediction
 from src.services.astrology_service import astrology_service
 from src.services.openrouter_service import openrouter_service
 
+# Environment read once at import
+SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-here')
+PORT = int(os.environ.get('PORT', 5000))
+
 app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-here')
+app.config['SECRET_KEY'] = SECRET_KEY
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
@@ -294,5 +298,4 @@ def handle_disconnect():
     print('Client disconnected')
 
 if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5000))
-    socketio.run(app, host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    socketio.run(app, host='0.0.0.0', port=PORT, debug=False)
\ No newline at end of file